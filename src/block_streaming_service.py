@@ -4,8 +4,8 @@ blockchain blocks and implementing the hotswap mechanism.
 """
 import logging
 import time
-import json
-from typing import Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional
 from src.hotswap_mechanism import HotswapMechanism
 
 
@@ -14,7 +14,11 @@ class BlockStreamingService:
     Service that streams blockchain blocks and manages provider hotswapping.
     """
     DEFAULT_BLOCK_TIME = 12
-    REQUIRED_FIELDS = ['number', 'hash', 'parentHash', 'timestamp']
+    REQUIRED_FIELDS = frozenset(('number', 'hash', 'parentHash', 'timestamp'))
+    # Adaptive polling settings in seconds
+    MIN_POLL_INTERVAL = 0.05
+    EMPTY_POLL_RETRY_DELAY = 0.2
+    EMPTY_POLL_RETRIES = 2
 
     def __init__(self, config: Dict[str, Any]):
         self.logger = logging.getLogger(__name__)
@@ -24,130 +28,275 @@ class BlockStreamingService:
         self.last_block_number = None
         self.expected_block_time = config.get('expected_block_time',
                                               self.DEFAULT_BLOCK_TIME)
+        self.max_block_processing_time = config.get('max_block_processing_time', 5)
+        self.head_only_mode = config.get('head_only_mode', False)
+        self.last_block_timestamp = None
+        self._empty_polls = 0
+        # Polls the next head while a catch up batch is being processed
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1,
+                                                     thread_name_prefix='head-prefetch')
 
     def start_streaming(self) -> None:
         """Start streaming blocks from the blockchain."""
         self.running = True
         self.logger.info("Block streaming started")
+        get_active_provider = self.hotswap.get_active_provider
+        prefetched_head = None
 
         while self.running:
             try:
                 # Get current active provider
-                provider = self.hotswap.get_active_provider()
+                provider = get_active_provider()
 
-                # Get latest block number
-                latest_block = provider.get_latest_block_number()
+                # Get latest block number, prefetched during the previous
+                # batch, pushed over WebSocket or polled over HTTP
+                latest_block = prefetched_head
+                polled = latest_block is not None
+                if latest_block is None:
+                    latest_block = provider.wait_for_new_head(self.expected_block_time)
+                if latest_block is None:
+                    latest_block = provider.get_latest_block_number()
+                    polled = True
 
                 # Process blocks sequentially
-                self._process_blocks_sequentially(provider, latest_block)
+                previous_block_number = self.last_block_number
+                prefetched_head = self._process_blocks_sequentially(provider, latest_block)
+                if prefetched_head is not None and prefetched_head <= self.last_block_number:
+                    prefetched_head = None
 
-                # Short sleep to prevent high CPU usage
-                time.sleep(0.5)
+                # Wait until the next block is expected to be available,
+                # unless the prefetched head shows we are still behind
+                if polled and prefetched_head is None:
+                    advanced = self.last_block_number != previous_block_number
+                    time.sleep(self._next_poll_interval(advanced))
 
             except Exception as e:
-                self.logger.error(f"Error in streaming loop: {str(e)}")
+                prefetched_head = None
+                self.logger.error("Error in streaming loop: %s", e)
                 self.hotswap.switch_provider(f"Exception: {str(e)}")
                 time.sleep(2)  # Give some time before reconnecting
 
     def _process_blocks_sequentially(self, provider,
-                                     latest_block: int) -> None:
+                                     latest_block: int) -> Optional[int]:
         """
-        Process blocks sequentially, ensuring no gaps.
+        Process blocks sequentially, ensuring no gaps. In head only mode a
+        gap of several blocks is skipped by processing only the latest block.
+
+        While catching up on several blocks, the next latest block number is
+        polled concurrently with validating and logging the batch.
 
         Args:
             provider: The blockchain provider to use
             latest_block: The latest block number available
+
+        Returns:
+            Optional[int]: The latest block number polled during a fully
+            processed catch up batch, None otherwise
         """
         if self.last_block_number is None:
             self.last_block_number = latest_block - 1
+        block_numbers = list(range(self.last_block_number + 1, latest_block + 1))
+        if not block_numbers:
+            return None
+        if self.head_only_mode and len(block_numbers) > 1:
+            self._process_head_block(provider, latest_block)
+            return None
+
+        # Bind hot path lookups to locals
+        monotonic = time.monotonic
+        max_processing_time = self.max_block_processing_time
+        switch_provider = self.hotswap.switch_provider
+        log_warning = self.logger.warning
+        accept_block = self._accept_block
+
+        # While catching up, poll the next head during validation
+        next_head = None
+        if len(block_numbers) > 1:
+            next_head = self._prefetch_executor.submit(provider.get_latest_block_number)
+
+        # Fetch blocks in batches when the provider supports it, and one by
+        # one otherwise, validating each batch before fetching the next
+        batch_size = provider.max_batch_size if provider.supports_batching else 1
+
         # For validate hashing sequence
         previous_hash = None
 
-        for block_num in range(self.last_block_number + 1, latest_block + 1):
-            start_time = time.time()
+        for batch_start in range(0, len(block_numbers), batch_size):
+            batch_numbers = block_numbers[batch_start:batch_start + batch_size]
+            start_time = monotonic()
             try:
-                block_data = provider.get_block(block_num)
-                if (not self._validate_block(block_data) or
-                        (previous_hash and not self._validate_hashing(previous_hash, block_data))):
-                    self.logger.warning(f"Block {block_num} validation failed")
-                    self.hotswap.switch_provider(
-                        f"Block validation failed for block {block_num}")
-                    return
-
-                self._log_block_data(block_num, block_data)
-
-                # Update last processed block
-                self.last_block_number = block_num
-
-                # Check block timing
-                processing_time = time.time() - start_time
-                if processing_time > self.config.get('max_block_processing_time', 5):
-                    self.logger.warning(f"Block {block_num} processing took {processing_time:.2f}s")
-                    # Consider switching provider if consistently slow
-                    self.hotswap.report_performance_issue("slow_processing", processing_time)
-                previous_hash = block_data.get('hash')
-
+                blocks = provider.get_blocks(batch_numbers)
             except Exception as e:
-                self.logger.error(f"Error processing block {block_num}: {str(e)}")
-                self.hotswap.switch_provider(f"Error processing block {block_num}: {str(e)}")
+                self.logger.error("Error fetching blocks %d-%d: %s",
+                                  batch_numbers[0], batch_numbers[-1], e)
+                switch_provider(f"Error fetching blocks {batch_numbers[0]}-{batch_numbers[-1]}: {str(e)}")
+                return None
+
+            for block_num, block_data in zip(batch_numbers, blocks):
+                try:
+                    if not accept_block(previous_hash, block_data):
+                        log_warning("Block %d validation failed", block_num)
+                        switch_provider(f"Block validation failed for block {block_num}")
+                        return None
+
+                    self._log_block_data(block_num, block_data)
+
+                    # Update last processed block
+                    self.last_block_number = block_num
+
+                    # Check block timing, the first block of a batch includes its fetch
+                    now = monotonic()
+                    processing_time = now - start_time
+                    if processing_time > max_processing_time:
+                        log_warning("Block %d processing took %.2fs", block_num, processing_time)
+                        # Consider switching provider if consistently slow
+                        self.hotswap.report_performance_issue("slow_processing", processing_time)
+                    previous_hash = block_data.get('hash')
+                    self.last_block_timestamp = block_data.get('timestamp')
+                    start_time = now
+
+                except Exception as e:
+                    self.logger.error("Error processing block %d: %s", block_num, e)
+                    switch_provider(f"Error processing block {block_num}: {str(e)}")
+                    return None
+
+        return self._prefetched_head(next_head)
+
+    def _prefetched_head(self, next_head: Optional[Future]) -> Optional[int]:
+        """
+        Get the result of a head number prefetch.
+
+        Args:
+            next_head: Future of the prefetch, or None if none was started
+
+        Returns:
+            Optional[int]: The prefetched latest block number, or None if
+            there was no prefetch or it failed
+        """
+        if next_head is None:
+            return None
+        try:
+            return next_head.result()
+        except Exception as e:
+            self.logger.warning("Prefetching latest block number failed: %s", e)
+            return None
+
+    def _process_head_block(self, provider, latest_block: int) -> None:
+        """
+        Process only the latest block, skipping the intermediate ones.
+
+        Args:
+            provider: The blockchain provider to use
+            latest_block: The latest block number available
+        """
+        gap = latest_block - self.last_block_number
+        start_time = time.monotonic()
+        try:
+            block_data = provider.get_block(latest_block)
+            if (not self._accept_block(None, block_data) or
+                    block_data['number'] != self.last_block_number + gap):
+                self.logger.warning("Block %d validation failed", latest_block)
+                self.hotswap.switch_provider(
+                    f"Block validation failed for block {latest_block}")
                 return
 
-    def _validate_block(self, block_data: Dict[str, Any]) -> bool:
+            self._log_block_data(latest_block, block_data, skipped_blocks=gap - 1)
+
+            # Update last processed block
+            self.last_block_number = latest_block
+            self.last_block_timestamp = block_data.get('timestamp')
+
+            # Check block timing
+            processing_time = time.monotonic() - start_time
+            if processing_time > self.max_block_processing_time:
+                self.logger.warning("Block %d processing took %.2fs", latest_block, processing_time)
+                self.hotswap.report_performance_issue("slow_processing", processing_time)
+
+        except Exception as e:
+            self.logger.error("Error processing block %d: %s", latest_block, e)
+            self.hotswap.switch_provider(f"Error processing block {latest_block}: {str(e)}")
+
+    def _next_poll_interval(self, advanced: bool) -> float:
         """
-        Validate block data integrity.
+        Compute how long to sleep before the next poll.
+
+        After a poll that advanced the chain, sleep until the next block is
+        expected based on the last block timestamp. After an empty poll,
+        retry a few times shortly, then fall back to a full block time.
 
         Args:
-            block_data: The block data to validate
+            advanced: Whether the last poll processed new blocks
 
         Returns:
-            bool: True if block data is valid, False otherwise
+            float: Sleep interval in seconds
         """
-        for field in self.REQUIRED_FIELDS:
-            if field not in block_data:
-                self.logger.warning(
-                    f"Missing required field: {field} in block data")
-                return False
-        return True
+        if advanced:
+            self._empty_polls = 0
+            if self.last_block_timestamp is None:
+                return self.expected_block_time
+            elapsed = time.time() - self.last_block_timestamp
+            return max(self.MIN_POLL_INTERVAL,
+                       self.expected_block_time - elapsed)
+
+        self._empty_polls += 1
+        if self._empty_polls <= self.EMPTY_POLL_RETRIES:
+            return self.EMPTY_POLL_RETRY_DELAY
+
+        self._empty_polls = 0
+        return self.expected_block_time
 
-    def _validate_hashing(self, previous_hash: str, current_block):
+    def _accept_block(self, previous_hash: Optional[bytes],
+                      block_data: Dict[str, Any]) -> bool:
         """
-        Validate hashing sequence -
-        previous_hash should be equal to current_block parent hash
+        Validate block data integrity and hashing sequence in one check -
+        the block must have all required fields and, when previous_hash is
+        given, its parent hash must be equal to previous_hash
 
         Args:
+            previous_hash: The previous block hash, None for the first block
             block_data: The block data to validate
-            previous_hash: The previous hash
 
         Returns:
             bool: True if block data is valid, False otherwise
         """
-        if current_block.get('parentHash') == previous_hash:
-            return True
-        self.logger.warning(f"Hashing previous hash is not compatible with parent hash of current block")
-        return False
+        missing = self.REQUIRED_FIELDS.difference(block_data)
+        if missing:
+            self.logger.warning("Missing required fields: %s in block data",
+                                sorted(missing))
+            return False
+        if previous_hash is not None and block_data['parentHash'] != previous_hash:
+            self.logger.warning("Hashing previous hash is not compatible with parent hash of current block")
+            return False
+        return True
 
     def _log_block_data(self, block_num: int,
-                        block_data: Dict[str, Any]) -> None:
+                        block_data: Dict[str, Any],
+                        skipped_blocks: int = 0) -> None:
         """
-        Log block data in a structured format.
+        Log block data as key=value pairs. Formatting is skipped entirely
+        when INFO logging is disabled.
 
         Args:
             block_num: Block number
             block_data: Block data to log
+            skipped_blocks: Number of preceding blocks skipped in head only mode
         """
-        log_data = {
-            'block_number': block_num,
-            'timestamp': block_data.get('timestamp'),
-            'hash': block_data.get('hash').hex(),
-            'parent_hash': block_data.get('parentHash').hex(),
-            'transaction_count': len(block_data.get('transactions', [])),
-            'size_bytes': block_data.get('size', 0)
-        }
-
-        # Log as JSON
-        self.logger.info(f"Block {block_num}: {json.dumps(log_data)}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        log_format = "Block %d ts=%s hash=%s parent=%s tx=%d size=%d"
+        log_args = (block_num, block_data.get('timestamp'),
+                    block_data['hash'].hex(), block_data['parentHash'].hex(),
+                    len(block_data.get('transactions', [])),
+                    block_data.get('size', 0))
+        if skipped_blocks:
+            log_format += " skipped=%d"
+            log_args += (skipped_blocks,)
+        self.logger.info(log_format, *log_args)
 
     def stop_streaming(self) -> None:
         """Stop the block streaming service."""
         self.running = False
+        self._prefetch_executor.shutdown(wait=False)
+        self.hotswap.close()
         self.logger.info("Block streaming stopped")
\ No newline at end of file
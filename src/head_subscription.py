@@ -0,0 +1,118 @@
+"""
+New heads subscription module responsible for receiving pushed block
+headers from a provider WebSocket endpoint.
+"""
+import asyncio
+import json
+import logging
+import threading
+from typing import Optional
+
+import websockets
+
+
+class HeadSubscription:
+    """
+    Background `eth_subscribe('newHeads')` subscription over WebSocket.
+
+    The subscription runs its own event loop on a daemon thread so the
+    synchronous streaming loop can wait for pushed heads without polling.
+    """
+    RECONNECT_DELAY = 2
+
+    def __init__(self, url: str, provider_name: str):
+        self.logger = logging.getLogger(
+            f"{__name__}.{self.__class__.__name__}")
+        self.url = url
+        self.name = provider_name
+        self.running = False
+        self.connected = threading.Event()
+        self._latest_head = None
+        self._new_head = threading.Event()
+        self._thread = None
+        self._loop = None
+        self._ws = None
+
+    def start(self) -> None:
+        """Start the subscription thread."""
+        self.running = True
+        self._thread = threading.Thread(target=asyncio.run,
+                                        args=(self._listen(),),
+                                        name=f"{self.name}-new-heads",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the subscription, closing its open connection."""
+        self.running = False
+        self.connected.clear()
+        loop, ws = self._loop, self._ws
+        if loop is not None and ws is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(ws.close(), loop)
+            except RuntimeError:
+                # The event loop has already finished
+                pass
+
+    def get_head(self, timeout: float) -> Optional[int]:
+        """
+        Wait for the next pushed head.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Optional[int]: The newest head block number, or None if the
+            subscription is not connected or no head arrived in time
+        """
+        if not self.connected.is_set():
+            return None
+        if not self._new_head.wait(timeout):
+            return None
+        self._new_head.clear()
+        return self._latest_head
+
+    def _on_head(self, block_number: int) -> None:
+        """
+        Record a pushed head and wake up a waiting consumer.
+
+        Args:
+            block_number: The new head block number
+        """
+        self._latest_head = block_number
+        self._new_head.set()
+
+    async def _listen(self) -> None:
+        """Keep a newHeads subscription open, reconnecting on failures."""
+        self._loop = asyncio.get_running_loop()
+        while self.running:
+            try:
+                async with websockets.connect(self.url) as ws:
+                    self._ws = ws
+                    if not self.running:
+                        break
+                    await ws.send(json.dumps({'jsonrpc': '2.0', 'id': 1,
+                                              'method': 'eth_subscribe',
+                                              'params': ['newHeads']}))
+                    response = json.loads(await ws.recv())
+                    if 'error' in response:
+                        raise ConnectionError(response['error'])
+
+                    self.connected.set()
+                    self.logger.info("Subscribed to new heads from %s", self.name)
+
+                    async for message in ws:
+                        if not self.running:
+                            break
+                        head = json.loads(message).get('params', {}).get('result', {})
+                        if 'number' in head:
+                            self._on_head(int(head['number'], 16))
+            except Exception as e:
+                if self.running:
+                    self.logger.warning("New heads subscription to %s failed: %s", self.name, e)
+            finally:
+                self._ws = None
+                self.connected.clear()
+
+            if self.running:
+                await asyncio.sleep(self.RECONNECT_DELAY)
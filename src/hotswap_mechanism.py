@@ -2,10 +2,13 @@
 Hotswap mechanism module responsible for monitoring provider health
 and switching between providers when needed.
 """
+import bisect
 import logging
+import threading
 import time
-from typing import Dict, Any
-import statistics
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, Tuple
 
 from src.provider import Provider
 from src.utils.config import ProviderName
@@ -19,37 +22,67 @@ class HotswapMechanism:
     def __init__(self, config: Dict[str, Any]):
         self.logger = logging.getLogger(__name__)
         self.config = config
+        self.error_threshold = config.get('error_threshold', 3)
+        self.max_measurements = config.get('max_measurements', 10)
+        self.max_avg_response_time = config.get('max_avg_response_time', 2.0)
+        self.min_switch_interval = config.get('min_switch_interval', 30)
         self.providers = self._initialize_providers()
         self.active_provider_name = config.get('default_provider', ProviderName.ALCHEMY)
         self.active_provider = self.providers.get(self.active_provider_name)
 
         # Health monitoring
         self.response_times = {}
+        self._response_time_sums = {}
         self.error_counts = {}
+        # Providers sorted by (error count, configured position, name)
+        self._fallback_order = []
         self.last_switch_time = time.time()
 
+        # Health check results: provider name -> (checked_at, healthy, latency)
+        self._health_cache = {}
+        self.health_check_interval = config.get('health_check_interval', 5)
+        self.health_cache_ttl = config.get('health_cache_ttl',
+                                           2 * self.health_check_interval)
+
         self._initialize_monitor_data_for_providers()
 
-        self.logger.info(f"Hotswap mechanism initialized with active provider: {self.active_provider_name}")
+        # Keep alternative providers' health fresh off the failover path
+        self._stop_health_checks = threading.Event()
+        self._health_thread = threading.Thread(target=self._health_loop,
+                                               name='provider-health',
+                                               daemon=True)
+        self._health_thread.start()
+
+        self.logger.info("Hotswap mechanism initialized with active provider: %s", self.active_provider_name)
 
     def _initialize_providers(self) -> Dict[str, Any]:
         """
-        Initialize all configured providers.
+        Initialize all configured providers concurrently, so startup
+        takes as long as the slowest provider connection.
 
         Returns:
             Dict: Dictionary of provider name to provider instance
         """
-        providers = {}
+        initialized = {}
         provider_configs = self.config.get('providers', {})
 
-        for provider_name, provider_config in provider_configs.items():
-            try:
-                provider = Provider(provider_config, provider_name)
-                providers[provider_name] = provider
-                self.logger.info(f"Initialized provider: {provider_name}")
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to initialize provider {provider_name}: {str(e)}")
+        if provider_configs:
+            with ThreadPoolExecutor(max_workers=len(provider_configs)) as executor:
+                futures = {executor.submit(Provider, provider_config, provider_name): provider_name
+                           for provider_name, provider_config in provider_configs.items()}
+                for future in as_completed(futures):
+                    provider_name = futures[future]
+                    try:
+                        initialized[provider_name] = future.result()
+                        self.logger.info("Initialized provider: %s", provider_name)
+                    except Exception as e:
+                        self.logger.error(
+                            "Failed to initialize provider %s: %s", provider_name, e)
+
+        # Keep the configured provider order
+        providers = {provider_name: initialized[provider_name]
+                     for provider_name in provider_configs
+                     if provider_name in initialized}
 
         if not providers:
             raise ValueError("No valid providers configured")
@@ -61,8 +94,12 @@ class HotswapMechanism:
         Initialize monitoring data for all providers
         '''
         for provider_name in self.providers:
-            self.response_times[provider_name] = []
+            # Keep only the last N measurements
+            self.response_times[provider_name] = deque(maxlen=self.max_measurements)
+            self._response_time_sums[provider_name] = 0.0
             self.error_counts[provider_name] = 0
+        self._fallback_order = [(0, position, provider_name)
+                                for position, provider_name in enumerate(self.providers)]
 
     def get_active_provider(self):
         """
@@ -81,34 +118,53 @@ class HotswapMechanism:
             reason: The reason for switching providers
         """
         # Avoid switch too frequently
-        min_switch_interval = self.config.get('min_switch_interval', 30)
-        if time.time() - self.last_switch_time < min_switch_interval:
+        if time.time() - self.last_switch_time < self.min_switch_interval:
             self.logger.info("Not switching provider: minimum interval not reached")
             return
 
         # Find the next available provider
         current_provider_name = self.active_provider_name
-        available_providers = [name for name, provider in
-                               self.providers.items()
-                               if
-                               name != current_provider_name and self._is_provider_healthy(name)]
+        candidates = [name for name in self.providers
+                      if name != current_provider_name]
+        stale_candidates = [name for name in candidates
+                            if self._cached_health(name) is None]
+        if stale_candidates:
+            # Run the missing health checks concurrently
+            with ThreadPoolExecutor(max_workers=len(stale_candidates)) as executor:
+                list(executor.map(self._check_provider_health, stale_candidates))
 
-        if not available_providers:
+        # Select the healthy provider with the least errors, then the lowest latency
+        next_provider_name = None
+        least_errors = None
+        next_latency = float('inf')
+        for error_count, _, name in self._fallback_order:
+            if name == current_provider_name or not self._health_cache[name][1]:
+                continue
+            if least_errors is None:
+                least_errors = error_count
+            elif error_count > least_errors:
+                break
+            latency = self._health_cache[name][2]
+            if latency < next_latency:
+                next_provider_name, next_latency = name, latency
+
+        if next_provider_name is None:
             self.logger.warning("No healthy alternative providers available")
             return
 
-        # Select the provider with the least errors or best performance
-        next_provider_name = min(available_providers,
-                                 key=lambda name: self.error_counts.get(name,
-                                                                        0))
-
-        # Switch to the new provider
+        # Switch to the new provider, forgetting the stale health of the old
+        # one and dropping its new heads subscription
+        self._health_cache.pop(current_provider_name, None)
+        previous_provider = self.providers.get(current_provider_name)
+        if previous_provider is not None:
+            previous_provider.stop_head_subscription()
         self.active_provider_name = next_provider_name
         self.active_provider = self.providers[next_provider_name]
         self.last_switch_time = time.time()
 
         self.logger.warning(
-            f"Switched provider from {current_provider_name} to {next_provider_name}. Reason: {reason}")
+            "Switched provider from %s to %s. Reason: %s",
+            current_provider_name, next_provider_name, reason)
 
     def report_performance_issue(self, issue_type: str, value: Any) -> None:
         """
@@ -121,45 +177,93 @@ class HotswapMechanism:
         provider_name = self.active_provider_name
 
         if issue_type == 'slow_processing':
-            self.response_times[provider_name].append(value)
-            # Keep only the last N measurements
-            max_measurements = self.config.get('max_measurements', 10)
-            if len(self.response_times[provider_name]) > max_measurements:
-                self.response_times[provider_name] = self.response_times[provider_name][-max_measurements:]
+            response_times = self.response_times[provider_name]
+            # Keep a running sum, dropping the sample the deque evicts
+            if len(response_times) == response_times.maxlen:
+                self._response_time_sums[provider_name] -= response_times[0]
+            response_times.append(value)
+            self._response_time_sums[provider_name] += value
 
             # Check if average response time is too high
-            if len(self.response_times[provider_name]) >= 3:
-                avg_time = statistics.mean(self.response_times[provider_name])
-                max_avg_time = self.config.get('max_avg_response_time', 2.0)
-                if avg_time > max_avg_time:
-                    self.logger.warning(f"Provider {provider_name} has high average response time: {avg_time:.2f}s")
+            if len(response_times) >= 3:
+                avg_time = self._response_time_sums[provider_name] / len(response_times)
+                if avg_time > self.max_avg_response_time:
+                    self.logger.warning("Provider %s has high average response time: %.2fs", provider_name, avg_time)
                     self.switch_provider(f"High average response time: {avg_time:.2f}s")
 
         elif issue_type == 'error':
-            self.error_counts[provider_name] += 1
-            error_threshold = self.config.get('error_threshold', 3)
-            if self.error_counts[provider_name] >= error_threshold:
-                self.logger.warning(f"Provider {provider_name} reached error threshold: {self.error_counts[provider_name]}")
+            self._record_error(provider_name)
+            if self.error_counts[provider_name] >= self.error_threshold:
+                self.logger.warning("Provider %s reached error threshold: %d", provider_name, self.error_counts[provider_name])
                 self.switch_provider(f"Error threshold reached: {self.error_counts[provider_name]}")
 
-    def _is_provider_healthy(self, provider_name: str) -> bool:
+    def _record_error(self, provider_name: str) -> None:
         """
-        Check if a provider is healthy.
+        Increase a provider's error count and move it in the fallback order.
 
         Args:
-            provider_name: Name of the provider to check
+            provider_name: Name of the provider that had an error
+        """
+        error_count = self.error_counts[provider_name]
+        index = bisect.bisect_left(self._fallback_order, (error_count,))
+        while self._fallback_order[index][2] != provider_name:
+            index += 1
+        _, position, _ = self._fallback_order.pop(index)
+
+        self.error_counts[provider_name] = error_count + 1
+        bisect.insort(self._fallback_order, (error_count + 1, position, provider_name))
+
+    def close(self) -> None:
+        """Stop background health checks and close all providers."""
+        self._stop_health_checks.set()
+        for provider in self.providers.values():
+            provider.close()
+
+    def _health_loop(self) -> None:
+        """
+        Periodically check the health of all non-active providers.
+        """
+        while not self._stop_health_checks.wait(self.health_check_interval):
+            for provider_name in list(self.providers):
+                if provider_name != self.active_provider_name:
+                    self._check_provider_health(provider_name)
+
+    def _cached_health(self, provider_name: str) -> Optional[Tuple[float, bool, float]]:
+        """
+        Get the recorded health of a provider if it is still fresh.
+
+        Args:
+            provider_name: Name of the provider
 
         Returns:
-            bool: True if provider is healthy, False otherwise
+            Optional[Tuple]: (checked_at, healthy, latency), or None if
+            missing or older than the health cache TTL
+        """
+        health = self._health_cache.get(provider_name)
+        if health and time.time() - health[0] < self.health_cache_ttl:
+            return health
+        return None
+
+    def _check_provider_health(self, provider_name: str) -> Tuple[float, bool, float]:
         """
-        provider: Provider = self.providers.get(provider_name)
-        if not provider:
-            return False
+        Check a provider's health and record the result.
 
+        Args:
+            provider_name: Name of the provider to check
+
+        Returns:
+            Tuple: (checked_at, healthy, latency)
+        """
+        provider: Provider = self.providers[provider_name]
+        start_time = time.time()
         try:
             # Simple health check - try to get the latest block number
             provider.get_latest_block_number()
-            return True
+            healthy = True
         except Exception as e:
-            self.logger.warning(f"Provider {provider_name} health check failed: {str(e)}")
-            return False
+            self.logger.warning("Provider %s health check failed: %s", provider_name, e)
+            healthy = False
+
+        health = (start_time, healthy, time.time() - start_time)
+        self._health_cache[provider_name] = health
+        return health
@@ -1,8 +1,53 @@
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
+from web3.types import RPCEndpoint, RPCResponse
 import logging
 
+from src.head_subscription import HeadSubscription
+
+DEFAULT_REQUEST_TIMEOUT = 5
+DEFAULT_MAX_BATCH_SIZE = 50
+
+
+def _create_shared_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all providers, so connections stay
+    pooled and alive when switching between providers.
+
+    Returns:
+        requests.Session: Session with a pooled, retrying adapter
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                          max_retries=Retry(total=2, backoff_factor=0.1))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+SHARED_SESSION = _create_shared_session()
+
+
+class SharedSessionHTTPProvider(Web3.HTTPProvider):
+    """
+    HTTP provider sending every request through SHARED_SESSION.
+
+    web3 caches sessions per thread, so a session passed to HTTPProvider is
+    only used by the thread that created it and every other thread gets a
+    plain session of its own.
+    """
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        request_data = self.encode_rpc_request(method, params)
+        response = SHARED_SESSION.post(self.endpoint_uri, data=request_data,
+                                       **self.get_request_kwargs())
+        response.raise_for_status()
+        return self.decode_rpc_response(response.content)
+
 
 class Provider:
     """
@@ -15,15 +60,30 @@ class Provider:
         self.config = config
         self.name = provider_type
         self.url = config.get('url')
+        self.ws_url = config.get('ws_url')
+        self.max_batch_size = config.get('max_batch_size', DEFAULT_MAX_BATCH_SIZE)
+        self._head_subscription = None
 
         if not self.url:
             raise ValueError(f"{self.name} URL is required")
 
-        self.web3 = Web3(Web3.HTTPProvider(self.url))
+        request_timeout = config.get('request_timeout', DEFAULT_REQUEST_TIMEOUT)
+        self.web3 = Web3(SharedSessionHTTPProvider(self.url,
+                                                   request_kwargs={'timeout': request_timeout}))
         if not self.web3.is_connected():
             raise ConnectionError(f"Failed to connect to {self.name} at {self.url}")
 
-        self.logger.info(f"Connected to {self.name} at {self.url}")
+        self.logger.info("Connected to %s at %s", self.name, self.url)
+
+    @property
+    def supports_batching(self) -> bool:
+        """
+        Whether the installed web3 supports JSON-RPC request batching.
+
+        Returns:
+            bool: True if blocks can be fetched in batched requests
+        """
+        return hasattr(self.web3, 'batch_requests')
 
     def get_latest_block_number(self) -> int:
         """
@@ -36,12 +96,44 @@ class Provider:
             result, execution_time = self._measure_request_time(
                 lambda: self.web3.eth.block_number)
             self.logger.debug(
-                f"Got latest block number from {self.name}: {result} (took {execution_time:.2f}s)")
+                "Got latest block number from %s: %d (took %.2fs)", self.name, result, execution_time)
             return result
         except Exception as e:
-            self.logger.error(f"Error getting latest block number from {self.name}: {str(e)}")
+            self.logger.error("Error getting latest block number from %s: %s", self.name, e)
             raise
 
+    def wait_for_new_head(self, timeout: float) -> Optional[int]:
+        """
+        Wait for a new head pushed over the provider WebSocket subscription.
+        The subscription is started on first use.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Optional[int]: The new head block number, or None if no WebSocket
+            URL is configured, the subscription is down or nothing arrived
+        """
+        if not self.ws_url:
+            return None
+        if self._head_subscription is None:
+            self._head_subscription = HeadSubscription(self.ws_url, self.name)
+            self._head_subscription.start()
+        return self._head_subscription.get_head(timeout)
+
+    def stop_head_subscription(self) -> None:
+        """
+        Stop the new heads subscription if one was started. It is started
+        again on the next wait_for_new_head call.
+        """
+        if self._head_subscription is not None:
+            self._head_subscription.stop()
+            self._head_subscription = None
+
+    def close(self) -> None:
+        """Release the provider's background resources."""
+        self.stop_head_subscription()
+
     def get_block(self, block_number: int) -> Dict[str, Any]:
         """
         Get block data for a specific block number from Provider.
@@ -54,12 +146,55 @@ class Provider:
         """
         try:
             result, execution_time = self._measure_request_time(self.web3.eth.get_block, block_number, full_transactions=False)
-            self.logger.debug(f"Got block {block_number} from {self.name} (took {execution_time:.2f}s)")
+            self.logger.debug("Got block %d from %s (took %.2fs)", block_number, self.name, execution_time)
             return result
         except Exception as e:
-            self.logger.error(f"Error getting block {block_number} from {self.name}: {str(e)}")
+            self.logger.error("Error getting block %d from %s: %s", block_number, self.name, e)
             raise
 
+    def get_blocks(self, block_numbers: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get block data for several block numbers from Provider, batched into
+        JSON-RPC requests of at most max_batch_size blocks when web3 supports
+        batching, and one request per block otherwise.
+
+        Args:
+            block_numbers: The block numbers to fetch
+
+        Returns:
+            List: Block data in the same order as block_numbers
+        """
+        if not self.supports_batching:
+            return [self.get_block(block_number) for block_number in block_numbers]
+
+        blocks = []
+        for start in range(0, len(block_numbers), self.max_batch_size):
+            batch_numbers = block_numbers[start:start + self.max_batch_size]
+            try:
+                result, execution_time = self._measure_request_time(self._fetch_batch, batch_numbers)
+                self.logger.debug("Got %d blocks from %s (took %.2fs)", len(result), self.name, execution_time)
+            except Exception as e:
+                self.logger.error("Error getting blocks %d-%d from %s: %s",
+                                  batch_numbers[0], batch_numbers[-1], self.name, e)
+                raise
+            blocks.extend(result)
+        return blocks
+
+    def _fetch_batch(self, block_numbers: List[int]) -> List[Dict[str, Any]]:
+        """
+        Fetch blocks in a single batched JSON-RPC request.
+
+        Args:
+            block_numbers: The block numbers to fetch
+
+        Returns:
+            List: Block data in the same order as block_numbers
+        """
+        with self.web3.batch_requests() as batch:
+            for block_number in block_numbers:
+                batch.add(self.web3.eth.get_block(block_number, full_transactions=False))
+            return list(batch.execute())
+
     @classmethod
     def _measure_request_time(cls, func, *args, **kwargs):
         """
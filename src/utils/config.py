@@ -4,13 +4,17 @@ Configuration module for loading and validating application config.
 import os
 import json
 import logging
+from enum import Enum
 from typing import Dict, Any
 
 
-class ProviderName:
+class ProviderName(str, Enum):
     ALCHEMY = 'alchemy'
     CHAINSTACK = 'chainstack'
 
+    def __str__(self) -> str:
+        return self.value
+
 
 def load_config() -> Dict[str, Any]:
     """
@@ -28,6 +32,7 @@ def load_config() -> Dict[str, Any]:
         'max_avg_response_time': 2.0,
         'error_threshold': 3,
         'min_switch_interval': 30,
+        'head_only_mode': False,
         'default_provider': ProviderName.ALCHEMY,
         'providers': {
             ProviderName.ALCHEMY: {
@@ -94,14 +99,17 @@ def validate_config(config: Dict[str, Any]) -> None:
 
 def deep_merge(dest: Dict[str, Any], src: Dict[str, Any]) -> None:
     """
-    Deep merge two dictionaries.
+    Deep merge two dictionaries iteratively, without recursion.
 
     Args:
         dest: Destination dictionary
         src: Source dictionary
     """
-    for key, value in src.items():
-        if key in dest and isinstance(dest[key], dict) and isinstance(value, dict):
-            deep_merge(dest[key], value)
-        else:
-            dest[key] = value
\ No newline at end of file
+    stack = [(dest, src)]
+    while stack:
+        dest_dict, src_dict = stack.pop()
+        for key, value in src_dict.items():
+            if key in dest_dict and isinstance(dest_dict[key], dict) and isinstance(value, dict):
+                stack.append((dest_dict[key], value))
+            else:
+                dest_dict[key] = value
\ No newline at end of file
@@ -4,6 +4,7 @@ Unit tests for block streaming service.
 import unittest
 from unittest.mock import MagicMock, patch
 import json
+import time
 
 from src.block_streaming_service import BlockStreamingService
 from src.utils.config import ProviderName
@@ -37,6 +38,8 @@ class TestBlockStreamingService(unittest.TestCase):
         self.mock_provider_patcher = patch(provider_path)
         self.mock_provider_class = self.mock_provider_patcher.start()
         self.mock_provider = MagicMock()
+        self.mock_provider.supports_batching = True
+        self.mock_provider.max_batch_size = 50
         self.mock_provider_class.return_value = self.mock_provider
 
         # Hotswap returns the mock provider
@@ -62,17 +65,112 @@ class TestBlockStreamingService(unittest.TestCase):
             'transactions': []
         }
 
-        self.mock_provider.get_block.return_value = mock_block
+        self.mock_provider.get_blocks.return_value = [mock_block]
 
         # Test processing a single block
         self.service._process_blocks_sequentially(self.mock_provider, 123)
 
-        # Verify that get_block was called
-        self.mock_provider.get_block.assert_called_once_with(123)
+        # Verify that the missing blocks were fetched in one batch
+        self.mock_provider.get_blocks.assert_called_once_with([123])
 
         # Verify that the last block number was updated
         self.assertEqual(self.service.last_block_number, 123)
 
+    def test_process_blocks_batch_broken_chain(self):
+        """Test that a batch stops at the first block breaking the hash chain."""
+        blocks = [
+            {'number': 11, 'hash': b'\x11', 'parentHash': b'\x10', 'timestamp': 1},
+            {'number': 12, 'hash': b'\x12', 'parentHash': b'\x11', 'timestamp': 2},
+            {'number': 13, 'hash': b'\x13', 'parentHash': b'\xff', 'timestamp': 3},
+        ]
+        self.mock_provider.get_blocks.return_value = blocks
+        self.service.last_block_number = 10
+
+        self.service._process_blocks_sequentially(self.mock_provider, 13)
+
+        self.mock_provider.get_blocks.assert_called_once_with([11, 12, 13])
+        self.assertEqual(self.service.last_block_number, 12)
+        self.mock_hotswap_instance.switch_provider.assert_called_once()
+
+    def test_process_blocks_without_batching(self):
+        """Test that blocks are fetched and timed one by one without batching."""
+        blocks = {n: {'number': n, 'hash': bytes([n]), 'parentHash': bytes([n - 1]), 'timestamp': n}
+                  for n in range(11, 21)}
+        clock = [0.0]
+
+        def get_blocks(block_numbers):
+            # Every request takes 0.5s, 5s for the whole gap
+            clock[0] += 0.5
+            return [blocks[n] for n in block_numbers]
+
+        self.mock_provider.supports_batching = False
+        self.mock_provider.get_blocks.side_effect = get_blocks
+        self.service.max_block_processing_time = 1
+        self.service.last_block_number = 10
+
+        with patch('time.monotonic', side_effect=lambda: clock[0]):
+            self.service._process_blocks_sequentially(self.mock_provider, 20)
+
+        self.assertEqual(self.mock_provider.get_blocks.call_count, 10)
+        self.mock_provider.get_blocks.assert_any_call([11])
+        self.assertEqual(self.service.last_block_number, 20)
+        self.mock_hotswap_instance.report_performance_issue.assert_not_called()
+
+    def test_process_blocks_keeps_fetched_batches(self):
+        """Test that a failing batch keeps the blocks of earlier batches."""
+        blocks = [
+            {'number': 11, 'hash': b'\x11', 'parentHash': b'\x10', 'timestamp': 1},
+            {'number': 12, 'hash': b'\x12', 'parentHash': b'\x11', 'timestamp': 2},
+        ]
+        self.mock_provider.max_batch_size = 2
+        self.mock_provider.get_blocks.side_effect = [blocks, Exception("Provider down")]
+        self.service.last_block_number = 10
+
+        self.service._process_blocks_sequentially(self.mock_provider, 14)
+
+        self.mock_provider.get_blocks.assert_any_call([11, 12])
+        self.mock_provider.get_blocks.assert_any_call([13, 14])
+        self.assertEqual(self.service.last_block_number, 12)
+        self.mock_hotswap_instance.switch_provider.assert_called_once()
+
+    def test_process_blocks_batch_prefetches_head(self):
+        """Test that catching up polls the next head during validation."""
+        blocks = [
+            {'number': 11, 'hash': b'\x11', 'parentHash': b'\x10', 'timestamp': 1},
+            {'number': 12, 'hash': b'\x12', 'parentHash': b'\x11', 'timestamp': 2},
+        ]
+        self.mock_provider.get_blocks.return_value = blocks
+        self.mock_provider.get_latest_block_number.return_value = 14
+        self.service.last_block_number = 10
+
+        next_head = self.service._process_blocks_sequentially(self.mock_provider, 12)
+
+        self.assertEqual(next_head, 14)
+        self.assertEqual(self.service.last_block_number, 12)
+
+    def test_process_blocks_head_only_mode(self):
+        """Test that head only mode fetches just the latest block."""
+        head_block = {'number': 15, 'hash': b'\x15', 'parentHash': b'\x14', 'timestamp': 5}
+        self.mock_provider.get_block.return_value = head_block
+        self.service.head_only_mode = True
+        self.service.last_block_number = 10
+
+        self.service._process_blocks_sequentially(self.mock_provider, 15)
+
+        self.mock_provider.get_block.assert_called_once_with(15)
+        self.mock_provider.get_blocks.assert_not_called()
+        self.assertEqual(self.service.last_block_number, 15)
+
+    def test_log_block_data(self):
+        """Test the key=value block log line."""
+        block = {'number': 15, 'hash': b'\x15', 'parentHash': b'\x14',
+                 'timestamp': 5, 'transactions': ['0x1', '0x2'], 'size': 100}
+
+        with self.assertLogs('src.block_streaming_service', 'INFO') as logs:
+            self.service._log_block_data(15, block, skipped_blocks=3)
+
+        self.assertIn("Block 15 ts=5 hash=15 parent=14 tx=2 size=100 skipped=3", logs.output[0])
+
     def test_validate_block(self):
         """Test block validation logic."""
         # Valid block
@@ -92,8 +190,84 @@ class TestBlockStreamingService(unittest.TestCase):
         }
 
         # Test validation
-        self.assertTrue(self.service._validate_block(valid_block))
-        self.assertFalse(self.service._validate_block(invalid_block))
+        self.assertTrue(self.service._accept_block(None, valid_block))
+        self.assertFalse(self.service._accept_block(None, invalid_block))
+
+    def test_start_streaming_uses_pushed_head(self):
+        """Test that a pushed head is processed without polling or sleeping."""
+        block = {'number': 124, 'hash': b'\x24', 'parentHash': b'\x23', 'timestamp': 1}
+
+        def get_blocks(block_numbers):
+            self.service.running = False
+            return [block]
+
+        self.mock_provider.wait_for_new_head.return_value = 124
+        self.mock_provider.get_blocks.side_effect = get_blocks
+
+        with patch('src.block_streaming_service.time.sleep') as mock_sleep:
+            self.service.start_streaming()
+
+        self.mock_provider.get_latest_block_number.assert_not_called()
+        self.mock_provider.get_blocks.assert_called_once_with([124])
+        mock_sleep.assert_not_called()
+        self.assertEqual(self.service.last_block_number, 124)
+
+    def test_start_streaming_uses_prefetched_head(self):
+        """Test that a prefetched head skips the sleep until an exception drops it."""
+        blocks = {n: {'number': n, 'hash': bytes([n]), 'parentHash': bytes([n - 1]), 'timestamp': n}
+                  for n in range(11, 16)}
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 2:
+                self.service.running = False
+
+        self.mock_provider.wait_for_new_head.return_value = None
+        # Poll, prefetch still ahead, poll after the exception, prefetch caught up
+        self.mock_provider.get_latest_block_number.side_effect = [12, 14, 15, 15]
+        self.mock_provider.get_blocks.side_effect = lambda numbers: [blocks[n] for n in numbers]
+        self.mock_hotswap_instance.get_active_provider.side_effect = [
+            self.mock_provider, Exception("Provider lookup failed"), self.mock_provider]
+        self.service.last_block_number = 10
+
+        with patch('src.block_streaming_service.time.sleep', side_effect=sleep):
+            self.service.start_streaming()
+
+        # No sleep after the first batch, the error sleep, then a poll interval
+        self.assertEqual(len(sleeps), 2)
+        self.assertEqual(sleeps[0], 2)
+        self.assertEqual(self.mock_provider.get_latest_block_number.call_count, 4)
+        self.mock_provider.get_blocks.assert_any_call([13, 14, 15])
+        self.assertEqual(self.service.last_block_number, 15)
+
+    def test_next_poll_interval(self):
+        """Test adaptive polling interval after full and empty polls."""
+        # Last block was just seen, wait roughly a full block time
+        self.service.last_block_timestamp = time.time()
+        interval = self.service._next_poll_interval(True)
+        self.assertGreater(interval, 11)
+        self.assertLessEqual(interval, 12)
+
+        # Last block is stale, poll again almost immediately
+        self.service.last_block_timestamp = time.time() - 60
+        self.assertEqual(self.service._next_poll_interval(True),
+                         self.service.MIN_POLL_INTERVAL)
+
+        # Empty polls retry shortly, then fall back to the block time
+        retry_delay = self.service.EMPTY_POLL_RETRY_DELAY
+        self.assertEqual(self.service._next_poll_interval(False), retry_delay)
+        self.assertEqual(self.service._next_poll_interval(False), retry_delay)
+        self.assertEqual(self.service._next_poll_interval(False), 12)
+
+    def test_accept_block(self):
+        """Test fused block and hashing sequence validation."""
+        block = {'number': 12, 'hash': b'\x12', 'parentHash': b'\x11', 'timestamp': 2}
+
+        self.assertTrue(self.service._accept_block(None, block))
+        self.assertTrue(self.service._accept_block(b'\x11', block))
+        self.assertFalse(self.service._accept_block(b'\xff', block))
+        self.assertFalse(self.service._accept_block(None, {'number': 12}))
 
 
 if __name__ == '__main__':
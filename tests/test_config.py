@@ -0,0 +1,46 @@
+"""
+Unit tests for configuration helpers.
+"""
+import unittest
+
+from src.utils.config import deep_merge
+
+
+class TestConfig(unittest.TestCase):
+    """
+    Test cases for the configuration helpers.
+    """
+
+    def test_deep_merge(self):
+        """Test merging nested overrides, new keys and replaced values."""
+        dest = {
+            'error_threshold': 3,
+            'timeouts': 5,
+            'providers': {
+                'alchemy': {'url': 'default_alchemy_url', 'request_timeout': 5},
+                'chainstack': {'url': 'default_chainstack_url'}
+            }
+        }
+        src = {
+            'head_only_mode': True,
+            'timeouts': {'request': 2},
+            'providers': {
+                'alchemy': {'url': 'file_alchemy_url'}
+            }
+        }
+
+        deep_merge(dest, src)
+
+        self.assertEqual(dest, {
+            'error_threshold': 3,
+            'head_only_mode': True,
+            'timeouts': {'request': 2},
+            'providers': {
+                'alchemy': {'url': 'file_alchemy_url', 'request_timeout': 5},
+                'chainstack': {'url': 'default_chainstack_url'}
+            }
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Unit tests for the new heads subscription.
+"""
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from src.head_subscription import HeadSubscription
+
+
+class FakeWebSocket:
+    """
+    WebSocket connection replaying a subscription response and messages.
+    """
+
+    def __init__(self, subscription, response, messages):
+        self.subscription = subscription
+        self.response = response
+        self.messages = messages
+        self.sent = []
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def close(self):
+        self.closed = True
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def recv(self):
+        return json.dumps(self.response)
+
+    async def _messages(self):
+        for message in self.messages:
+            yield json.dumps(message)
+        # Stop listening once all messages were replayed
+        self.subscription.running = False
+
+    def __aiter__(self):
+        return self._messages()
+
+
+class TestHeadSubscription(unittest.TestCase):
+    """
+    Test cases for the HeadSubscription class without a network connection.
+    """
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.subscription = HeadSubscription('wss://mock-url', 'mock')
+
+    def test_get_head_when_disconnected(self):
+        """Test that a disconnected subscription does not block."""
+        self.subscription._on_head(100)
+        self.assertIsNone(self.subscription.get_head(timeout=5))
+
+    def test_get_head_returns_newest(self):
+        """Test that only the newest pushed head is returned."""
+        self.subscription.connected.set()
+        self.subscription._on_head(100)
+        self.subscription._on_head(101)
+
+        self.assertEqual(self.subscription.get_head(timeout=0), 101)
+        self.assertIsNone(self.subscription.get_head(timeout=0))
+
+    def test_listen_parses_new_heads(self):
+        """Test that hex head numbers from notifications are recorded."""
+        ws = FakeWebSocket(self.subscription, {'jsonrpc': '2.0', 'id': 1, 'result': '0xabc'},
+                           [{'params': {'subscription': '0xabc', 'result': {'number': '0x10'}}},
+                            {'params': {'subscription': '0xabc', 'result': {'number': '0x11'}}}])
+        self.subscription.running = True
+
+        with patch('src.head_subscription.websockets.connect', return_value=ws):
+            asyncio.run(self.subscription._listen())
+
+        self.assertEqual(ws.sent[0]['method'], 'eth_subscribe')
+        self.assertEqual(ws.sent[0]['params'], ['newHeads'])
+        self.assertEqual(self.subscription._latest_head, 0x11)
+        self.assertFalse(self.subscription.connected.is_set())
+
+    def test_listen_error_response(self):
+        """Test that a rejected subscription never reports as connected."""
+        ws = FakeWebSocket(self.subscription, {'jsonrpc': '2.0', 'id': 1,
+                                               'error': {'code': -32601, 'message': 'not supported'}},
+                           [{'params': {'result': {'number': '0x10'}}}])
+
+        def connect(url):
+            # Reject once, then stop before reconnecting
+            if connect.calls:
+                self.subscription.running = False
+                raise ConnectionError("Stopped")
+            connect.calls += 1
+            return ws
+
+        connect.calls = 0
+        self.subscription.RECONNECT_DELAY = 0
+        self.subscription.running = True
+        with patch('src.head_subscription.websockets.connect', side_effect=connect), \
+                self.assertLogs('src.head_subscription', 'WARNING') as logs:
+            asyncio.run(self.subscription._listen())
+
+        self.assertIn('not supported', logs.output[0])
+        self.assertIsNone(self.subscription._latest_head)
+        self.assertFalse(self.subscription.connected.is_set())
+
+    def test_stop_closes_open_connection(self):
+        """Test that stopping closes a connection waiting for messages."""
+        class IdleWebSocket(FakeWebSocket):
+            async def __aenter__(self):
+                self.closing = asyncio.Event()
+                return self
+
+            async def close(self):
+                self.closed = True
+                self.closing.set()
+
+            async def _messages(self):
+                await self.closing.wait()
+                return
+                yield
+
+        ws = IdleWebSocket(self.subscription, {'jsonrpc': '2.0', 'id': 1, 'result': '0xabc'}, [])
+
+        with patch('src.head_subscription.websockets.connect', return_value=ws):
+            self.subscription.start()
+            self.assertTrue(self.subscription.connected.wait(timeout=5))
+            self.subscription.stop()
+            self.subscription._thread.join(timeout=5)
+
+        self.assertFalse(self.subscription._thread.is_alive())
+        self.assertTrue(ws.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Unit tests for the hotswap mechanism.
+"""
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.hotswap_mechanism import HotswapMechanism
+from src.utils.config import ProviderName
+
+
+class TestHotswapMechanism(unittest.TestCase):
+    """
+    Test cases for the HotswapMechanism class with mocked providers.
+    """
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_config = {
+            'default_provider': ProviderName.ALCHEMY,
+            'min_switch_interval': 0,
+            'health_cache_ttl': 60,
+            'error_threshold': 2,
+            'providers': {
+                ProviderName.ALCHEMY: {'url': 'mock://alchemy-url'},
+                ProviderName.CHAINSTACK: {'url': 'mock://chainstack-url'}
+            }
+        }
+
+        # Patch the Provider class in the context where it's used by HotswapMechanism
+        self.provider_patcher = patch('src.hotswap_mechanism.Provider',
+                                      side_effect=lambda cfg, name: MagicMock(name=name))
+        self.mock_provider_class = self.provider_patcher.start()
+
+        self.hotswap = HotswapMechanism(self.mock_config)
+
+    def tearDown(self):
+        """Stop patchers."""
+        self.hotswap.close()
+        self.provider_patcher.stop()
+
+    def test_failed_provider_is_skipped(self):
+        """Test that providers failing to connect are left out."""
+        def create_provider(cfg, name):
+            if name == ProviderName.CHAINSTACK:
+                raise ConnectionError("Failed to connect")
+            return MagicMock(name=name)
+
+        self.mock_provider_class.side_effect = create_provider
+        hotswap = HotswapMechanism(self.mock_config)
+        hotswap.close()
+
+        self.assertEqual(list(hotswap.providers), [ProviderName.ALCHEMY])
+
+    def test_switch_from_failed_default_provider(self):
+        """Test failing over when the default provider failed to initialize."""
+        def create_provider(cfg, name):
+            if name == ProviderName.ALCHEMY:
+                raise ConnectionError("Failed to connect")
+            return MagicMock(name=name)
+
+        self.mock_provider_class.side_effect = create_provider
+        hotswap = HotswapMechanism(self.mock_config)
+        hotswap.close()
+        self.assertIsNone(hotswap.get_active_provider())
+
+        hotswap.switch_provider("Exception")
+
+        self.assertEqual(hotswap.active_provider_name, ProviderName.CHAINSTACK)
+        self.assertIs(hotswap.get_active_provider(),
+                      hotswap.providers[ProviderName.CHAINSTACK])
+
+    def test_health_check_is_cached(self):
+        """Test that failover reuses health results recorded within the TTL."""
+        chainstack = self.hotswap.providers[ProviderName.CHAINSTACK]
+        chainstack.get_latest_block_number.side_effect = Exception("Provider down")
+
+        # Both failovers find chainstack unhealthy, only the first checks it
+        self.hotswap.switch_provider("test")
+        self.hotswap.switch_provider("test")
+
+        self.assertEqual(self.hotswap.active_provider_name, ProviderName.ALCHEMY)
+        chainstack.get_latest_block_number.assert_called_once()
+
+    def test_switch_provider(self):
+        """Test switching to the healthy alternative provider."""
+        self.hotswap.switch_provider("test")
+
+        self.assertEqual(self.hotswap.active_provider_name, ProviderName.CHAINSTACK)
+        self.assertIs(self.hotswap.get_active_provider(),
+                      self.hotswap.providers[ProviderName.CHAINSTACK])
+        self.hotswap.providers[ProviderName.ALCHEMY].stop_head_subscription.assert_called_once()
+
+    def test_switch_provider_uses_recorded_health(self):
+        """Test that failover reads background health results without RPCs."""
+        chainstack = self.hotswap.providers[ProviderName.CHAINSTACK]
+        self.hotswap._health_cache[ProviderName.CHAINSTACK] = (time.time(), False, 0.1)
+
+        self.hotswap.switch_provider("test")
+
+        self.assertEqual(self.hotswap.active_provider_name, ProviderName.ALCHEMY)
+        chainstack.get_latest_block_number.assert_not_called()
+
+    def test_errors_reorder_fallback_order(self):
+        """Test that error reports keep the fallback order sorted."""
+        self.hotswap.report_performance_issue('error', None)
+
+        self.assertEqual(self.hotswap.error_counts[ProviderName.ALCHEMY], 1)
+        self.assertEqual(self.hotswap._fallback_order,
+                         [(0, 1, ProviderName.CHAINSTACK), (1, 0, ProviderName.ALCHEMY)])
+
+    def test_switch_provider_prefers_errors_then_latency(self):
+        """Test that fewer errors beat lower latency, which breaks ties."""
+        self.mock_config['providers']['quicknode'] = {'url': 'mock://quicknode-url'}
+        hotswap = HotswapMechanism(self.mock_config)
+        hotswap.close()
+        now = time.time()
+        hotswap._health_cache[ProviderName.CHAINSTACK] = (now, True, 0.1)
+        hotswap._health_cache['quicknode'] = (now, True, 0.5)
+
+        # Chainstack is faster but had an error
+        hotswap.active_provider_name = ProviderName.CHAINSTACK
+        hotswap.report_performance_issue('error', None)
+        hotswap.active_provider_name = ProviderName.ALCHEMY
+        hotswap.switch_provider("test")
+        self.assertEqual(hotswap.active_provider_name, 'quicknode')
+
+        # With equal error counts the faster chainstack wins
+        hotswap.active_provider_name = 'quicknode'
+        hotswap.report_performance_issue('error', None)
+        hotswap.active_provider_name = ProviderName.ALCHEMY
+        hotswap.switch_provider("test")
+        self.assertEqual(hotswap.active_provider_name, ProviderName.CHAINSTACK)
+
+    def test_response_times_are_bounded(self):
+        """Test that only the last max_measurements samples are kept."""
+        for value in range(15):
+            self.hotswap.report_performance_issue('slow_processing', 0.1 * value)
+
+        response_times = self.hotswap.response_times[ProviderName.ALCHEMY]
+        self.assertEqual(len(response_times), 10)
+        self.assertAlmostEqual(response_times[0], 0.5)
+        self.assertAlmostEqual(self.hotswap._response_time_sums[ProviderName.ALCHEMY],
+                               sum(response_times))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the blockchain provider.
+"""
+import threading
+import unittest
+from unittest.mock import MagicMock, patch, call
+
+import requests
+
+from src.provider import Provider, SHARED_SESSION
+
+
+class TestProvider(unittest.TestCase):
+    """
+    Test cases for the Provider class with a mocked web3 client.
+    """
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.web3_patcher = patch('src.provider.Web3')
+        self.mock_web3_class = self.web3_patcher.start()
+        self.mock_web3 = MagicMock()
+        self.mock_web3_class.return_value = self.mock_web3
+        self.mock_web3.eth.get_block.side_effect = lambda n, full_transactions: {'number': n}
+
+        self.provider = Provider({'url': 'mock://url', 'max_batch_size': 2}, 'mock')
+
+    def tearDown(self):
+        """Stop patchers."""
+        self.web3_patcher.stop()
+
+    def test_get_blocks_without_batching(self):
+        """Test that blocks are fetched one request at a time without batching."""
+        del self.mock_web3.batch_requests
+
+        blocks = self.provider.get_blocks([11, 12, 13])
+
+        self.assertFalse(self.provider.supports_batching)
+        self.assertEqual(blocks, [{'number': 11}, {'number': 12}, {'number': 13}])
+        self.mock_web3.eth.get_block.assert_has_calls([
+            call(11, full_transactions=False),
+            call(12, full_transactions=False),
+            call(13, full_transactions=False),
+        ])
+
+    def test_get_blocks_with_batching(self):
+        """Test that batched fetches are split into max_batch_size requests."""
+        batch = self.mock_web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.side_effect = [[{'number': 11}, {'number': 12}], [{'number': 13}]]
+
+        blocks = self.provider.get_blocks([11, 12, 13])
+
+        self.assertTrue(self.provider.supports_batching)
+        self.assertEqual(blocks, [{'number': 11}, {'number': 12}, {'number': 13}])
+        self.assertEqual(self.mock_web3.batch_requests.call_count, 2)
+        self.assertEqual(batch.add.call_count, 3)
+
+
+class TestProviderSession(unittest.TestCase):
+    """
+    Test cases for the HTTP session used by providers.
+    """
+
+    def test_requests_use_shared_session_from_any_thread(self):
+        """Test that requests made from other threads reuse the shared session."""
+        used_sessions = []
+
+        def post(session, url, **kwargs):
+            used_sessions.append((threading.current_thread().name, session))
+            response = MagicMock()
+            response.content = b'{"jsonrpc": "2.0", "id": 0, "result": "0x10"}'
+            return response
+
+        with patch.object(requests.Session, 'post', autospec=True, side_effect=post):
+            provider = Provider({'url': 'http://mock-url'}, 'mock')
+            thread = threading.Thread(target=provider.get_latest_block_number,
+                                      name='health-check')
+            thread.start()
+            thread.join()
+
+        self.assertEqual([name for name, _ in used_sessions],
+                         [threading.current_thread().name, 'health-check'])
+        for _, session in used_sessions:
+            self.assertIs(session, SHARED_SESSION)
+
+
+if __name__ == '__main__':
+    unittest.main()